@@ -5,21 +5,58 @@ Production-grade Flask API for currency conversion
 """
 
 from flask import Flask, request, jsonify, send_from_directory, send_file
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import logging
+import math
 import os
-import json
+import time
 from datetime import datetime
+from functools import lru_cache
 
-# Configure logging
+try:
+    import orjson
+except ImportError:  # Fall back to Flask's stdlib-based JSON provider
+    orjson = None
+
+# Configure logging (LOG_LEVEL=WARNING disables per-request logging)
+_LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+# An unknown level name would make basicConfig raise and stop every worker from booting
+_LOG_LEVEL_VALID = _LOG_LEVEL in logging.getLevelNamesMapping()
 logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    level=_LOG_LEVEL if _LOG_LEVEL_VALID else "INFO",
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 logger = logging.getLogger(__name__)
+if not _LOG_LEVEL_VALID:
+    logger.warning("Unknown LOG_LEVEL %r, falling back to INFO", _LOG_LEVEL)
+
+
+# JSON provider
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for faster (de)serialization"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Skip the bytes -> str -> bytes round trip of the default implementation
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default), mimetype=self.mimetype
+        )
+
 
 # Create Flask app
 app = Flask(__name__)
 
+# Serialize JSON responses with orjson when it is available
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+
 # Enable CORS for all routes (production should be more restrictive)
 CORS(
     app,
@@ -41,6 +78,14 @@ class Config:
     API_VERSION = "1.0.0"
     SUPPORTED_CURRENCIES = ["USD", "EUR", "GBP", "JPY"]
 
+    # How long clients and reverse proxies may cache GET responses (seconds)
+    HEALTH_CACHE_MAX_AGE = 1
+    INFO_CACHE_MAX_AGE = 3600
+    RATES_CACHE_MAX_AGE = 60
+
+    # Upper bound on items accepted by /api/convert/batch
+    MAX_BATCH_SIZE = 500
+
     # Hardcoded exchange rates (base: USD)
     # In production, these would come from an external service
     EXCHANGE_RATES = {
@@ -53,12 +98,154 @@ class Config:
 
 config = Config()
 
+# Set view of the supported currencies for O(1) membership checks
+_SUPPORTED_CURRENCIES = frozenset(config.SUPPORTED_CURRENCIES)
+
+# Row-major rate table indexed by currency position, built from EXCHANGE_RATES
+_CURRENCY_INDEX = {
+    currency: index for index, currency in enumerate(config.SUPPORTED_CURRENCIES)
+}
+_RATE_MATRIX = tuple(
+    tuple(config.EXCHANGE_RATES[base][target] for target in config.SUPPORTED_CURRENCIES)
+    for base in config.SUPPORTED_CURRENCIES
+)
+
+
+@lru_cache(maxsize=4096)
+def _convert_amount(amount, from_index, to_index):
+    """Convert an amount between two rate matrix positions, rounded to cents"""
+    return round(amount * _RATE_MATRIX[from_index][to_index], 2)
+
+
+# Timestamps
+@lru_cache(maxsize=1)
+def _iso_timestamp(epoch_second):
+    """Format a whole epoch second as an ISO-8601 UTC timestamp"""
+    # Explicit "Z" so clients such as the frontend's Date() don't read it as local time
+    return datetime.utcfromtimestamp(epoch_second).isoformat() + "Z"
+
+
+def _utc_timestamp():
+    """Current UTC timestamp, formatted at most once per second"""
+    return _iso_timestamp(int(time.time()))
+
+
+# Pre-serialized response bodies
+def _json_body(payload):
+    """Serialize a payload once into a reusable JSON response body"""
+    return app.json.dumps(payload).encode()
+
+
+def _json_response(body, status=200, headers=None):
+    """Build a JSON response from a pre-serialized body"""
+    return app.response_class(
+        body, status=status, headers=headers, mimetype=app.json.mimetype
+    )
+
+
+def _cache_headers(max_age):
+    """Cache-Control header allowing shared caches to store a response"""
+    return {"Cache-Control": f"public, max-age={max_age}"}
+
+
+def _timestamp_prefix(payload):
+    """Serialize a payload, leaving it open for a trailing timestamp field"""
+    return _json_body(payload)[:-1] + b',"timestamp":"'
+
+
+@lru_cache(maxsize=2 * (len(config.SUPPORTED_CURRENCIES) + 1))
+def _stamped_body(prefix, epoch_second):
+    """Close a body opened by _timestamp_prefix, built once per prefix and second"""
+    return prefix + _iso_timestamp(epoch_second).encode() + b'"}'
+
+
+def _timestamped_body(prefix):
+    """Close a pre-serialized body opened by _timestamp_prefix with the current time"""
+    return _stamped_body(prefix, int(time.time()))
+
+
+_HEALTH_PREFIX = _timestamp_prefix(
+    {
+        "status": "healthy",
+        "message": "Currency converter API is running",
+        "version": config.API_VERSION,
+        "supported_currencies": config.SUPPORTED_CURRENCIES,
+    }
+)
+
+_API_INFO_BODY = _json_body(
+    {
+        "name": "Currency Converter API",
+        "version": config.API_VERSION,
+        "endpoints": {
+            "health": "GET /health",
+            "convert": "POST /api/convert",
+            "convert_batch": "POST /api/convert/batch",
+            "rates": "GET /api/rates",
+        },
+        "supported_currencies": config.SUPPORTED_CURRENCIES,
+    }
+)
+
+_HEALTH_HEADERS = _cache_headers(config.HEALTH_CACHE_MAX_AGE)
+_NO_STORE_HEADERS = {"Cache-Control": "no-store"}
+_API_INFO_HEADERS = _cache_headers(config.INFO_CACHE_MAX_AGE)
+_RATES_HEADERS = _cache_headers(config.RATES_CACHE_MAX_AGE)
+
+_RATES_PREFIXES = {
+    currency: _timestamp_prefix(
+        {"base_currency": currency, "rates": config.EXCHANGE_RATES[currency]}
+    )
+    for currency in config.SUPPORTED_CURRENCIES
+}
+
+# Constant /api/convert validation errors
+_ERROR_NO_JSON = {"error": "No JSON data provided"}
+_ERROR_INVALID_JSON = {"error": "Invalid JSON data provided"}
+_ERROR_NOT_OBJECT = {"error": "Conversion request must be a JSON object"}
+_ERROR_AMOUNT_REQUIRED = {"error": "Amount is required"}
+_ERROR_AMOUNT_NOT_NUMBER = {"error": "Amount must be a valid number"}
+_ERROR_AMOUNT_NEGATIVE = {"error": "Amount must be positive"}
+_ERROR_CURRENCIES_REQUIRED = {"error": "Both from and to currencies are required"}
+_ERROR_CONVERSIONS_REQUIRED = {"error": "A list of conversions is required"}
+_ERROR_BATCH_TOO_LARGE = {
+    "error": f"At most {config.MAX_BATCH_SIZE} conversions are allowed per batch"
+}
+
+# Pre-serialized bodies for the constant errors, keyed by message
+_ERROR_BODIES = {
+    error["error"]: _json_body(error)
+    for error in (
+        _ERROR_NO_JSON,
+        _ERROR_INVALID_JSON,
+        _ERROR_NOT_OBJECT,
+        _ERROR_AMOUNT_REQUIRED,
+        _ERROR_AMOUNT_NOT_NUMBER,
+        _ERROR_AMOUNT_NEGATIVE,
+        _ERROR_CURRENCIES_REQUIRED,
+        _ERROR_CONVERSIONS_REQUIRED,
+        _ERROR_BATCH_TOO_LARGE,
+    )
+}
+
+
+def _error_response(error, status=400):
+    """Build an error response, reusing the pre-serialized body when there is one"""
+    body = _ERROR_BODIES.get(error["error"])
+    if body is None:
+        return jsonify(error), status
+    return _json_response(body, status)
+
 
 # Middleware for request logging
-@app.before_request
 def log_request():
     """Log incoming requests"""
-    logger.info(f"{request.method} {request.path} - {request.remote_addr}")
+    logger.info("%s %s - %s", request.method, request.path, request.remote_addr)
+
+
+# Only add the hook to the request pipeline when INFO logs are actually emitted
+if logger.isEnabledFor(logging.INFO):
+    app.before_request(log_request)
 
 
 # Health check endpoint
@@ -66,39 +253,16 @@ def log_request():
 def health():
     """Health check endpoint for monitoring"""
     logger.info("Health check requested")
-    return (
-        jsonify(
-            {
-                "status": "healthy",
-                "message": "Currency converter API is running",
-                "version": config.API_VERSION,
-                "timestamp": datetime.utcnow().isoformat(),
-                "supported_currencies": config.SUPPORTED_CURRENCIES,
-            }
-        ),
-        200,
-    )
+    # Probes that add query parameters (e.g. cache busters) always want a fresh answer
+    headers = _NO_STORE_HEADERS if request.args else _HEALTH_HEADERS
+    return _json_response(_timestamped_body(_HEALTH_PREFIX), headers=headers)
 
 
 # API info endpoint
 @app.route("/api/info", methods=["GET"])
 def api_info():
     """API information endpoint"""
-    return (
-        jsonify(
-            {
-                "name": "Currency Converter API",
-                "version": config.API_VERSION,
-                "endpoints": {
-                    "health": "GET /health",
-                    "convert": "POST /api/convert",
-                    "rates": "GET /api/rates",
-                },
-                "supported_currencies": config.SUPPORTED_CURRENCIES,
-            }
-        ),
-        200,
-    )
+    return _json_response(_API_INFO_BODY, headers=_API_INFO_HEADERS)
 
 
 # Get exchange rates endpoint
@@ -107,7 +271,7 @@ def get_rates():
     """Get all exchange rates"""
     base_currency = request.args.get("base", "USD").upper()
 
-    if base_currency not in config.SUPPORTED_CURRENCIES:
+    if base_currency not in _SUPPORTED_CURRENCIES:
         return (
             jsonify(
                 {
@@ -118,15 +282,120 @@ def get_rates():
             400,
         )
 
+    return _json_response(
+        _timestamped_body(_RATES_PREFIXES[base_currency]), headers=_RATES_HEADERS
+    )
+
+
+def _read_json_body():
+    """Decode the request body, returning a (data, error) pair"""
+    # Parse the raw body ourselves so a missing Content-Type header is tolerated
+    raw = request.get_data(cache=False)
+    if not raw:
+        return None, _ERROR_NO_JSON
+
+    try:
+        return app.json.loads(raw), None
+    except ValueError as json_error:
+        logger.warning(f"Invalid JSON request: {str(json_error)}")
+        return None, _ERROR_INVALID_JSON
+
+
+def _convert_one(data):
+    """Validate and perform a single conversion, returning a (result, error) pair"""
+    # Validate request data
+    if not isinstance(data, dict):
+        return None, _ERROR_NOT_OBJECT
+
+    # Extract and validate required fields
+    amount = data.get("amount")
+    from_currency = data.get("from", "")
+    to_currency = data.get("to", "")
+
+    # Validate amount
+    if amount is None:
+        return None, _ERROR_AMOUNT_REQUIRED
+
+    # JSON numbers decode to int/float, so only numeric strings need parsing
+    if isinstance(amount, (int, float)) and not isinstance(amount, bool):
+        try:
+            amount = float(amount)
+        except OverflowError:  # Integers too large for a float (stdlib json decoding)
+            return None, _ERROR_AMOUNT_NOT_NUMBER
+    elif isinstance(amount, str):
+        try:
+            amount = float(amount)
+        except ValueError:
+            return None, _ERROR_AMOUNT_NOT_NUMBER
+    else:
+        return None, _ERROR_AMOUNT_NOT_NUMBER
+
+    # float() accepts "nan", "inf" and overflowing literals like "1e400"
+    if not math.isfinite(amount):
+        return None, _ERROR_AMOUNT_NOT_NUMBER
+
+    if amount < 0:
+        return None, _ERROR_AMOUNT_NEGATIVE
+
+    # Validate currencies
+    if not isinstance(from_currency, str) or not isinstance(to_currency, str):
+        return None, _ERROR_CURRENCIES_REQUIRED
+
+    from_currency = from_currency.upper()
+    to_currency = to_currency.upper()
+    if not from_currency or not to_currency:
+        return None, _ERROR_CURRENCIES_REQUIRED
+
+    if from_currency not in _SUPPORTED_CURRENCIES:
+        return None, {
+            "error": f"Unsupported source currency: {from_currency}",
+            "supported_currencies": config.SUPPORTED_CURRENCIES,
+        }
+
+    if to_currency not in _SUPPORTED_CURRENCIES:
+        return None, {
+            "error": f"Unsupported target currency: {to_currency}",
+            "supported_currencies": config.SUPPORTED_CURRENCIES,
+        }
+
+    # Get exchange rate
+    from_index = _CURRENCY_INDEX[from_currency]
+    to_index = _CURRENCY_INDEX[to_currency]
+    exchange_rate = _RATE_MATRIX[from_index][to_index]
+
+    # Calculate converted amount
+    converted_amount = _convert_amount(amount, from_index, to_index)
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Converted %s %s to %s %s",
+            amount,
+            from_currency,
+            converted_amount,
+            to_currency,
+        )
+
+    return {
+        "success": True,
+        "original_amount": amount,
+        "from_currency": from_currency,
+        "to_currency": to_currency,
+        "converted_amount": converted_amount,
+        "exchange_rate": exchange_rate,
+        "timestamp": _utc_timestamp(),
+    }, None
+
+
+def _conversion_failed():
+    """500 response for unexpected conversion failures"""
     return (
         jsonify(
             {
-                "base_currency": base_currency,
-                "rates": config.EXCHANGE_RATES[base_currency],
-                "timestamp": datetime.utcnow().isoformat(),
+                "error": "Internal server error",
+                "message": "An unexpected error occurred during conversion",
             }
         ),
-        200,
+        500,
     )
 
 
@@ -135,123 +404,84 @@ def get_rates():
 def convert():
     """Convert currency amounts"""
     try:
-        # Get JSON data from request
-        try:
-            data = request.get_json()
-            if data is None:
-                # Try to handle cases where Content-Type is missing but data might be JSON
-                if request.data:
-                    try:
-                        data = json.loads(request.data)
-                    except json.JSONDecodeError:
-                        return jsonify({"error": "Invalid JSON data provided"}), 400
-                else:
-                    return jsonify({"error": "No JSON data provided"}), 400
-        except Exception as json_error:
-            logger.warning(f"Invalid JSON request: {str(json_error)}")
-            return jsonify({"error": "Invalid JSON data or missing Content-Type header"}), 400
-        
-        logger.info(f"Conversion request: {data}")
-
-        # Validate request data
+        data, error = _read_json_body()
+        if error is not None:
+            return _error_response(error)
+
+        # An empty body object means nothing was sent; batch items report their own errors
         if not data:
-            return jsonify({"error": "No JSON data provided"}), 400
+            return _error_response(_ERROR_NO_JSON)
 
-        # Extract and validate required fields
-        amount = data.get("amount")
-        from_currency = data.get("from", "").upper()
-        to_currency = data.get("to", "").upper()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Conversion request: %s", data)
 
-        # Validate amount
-        if amount is None:
-            return jsonify({"error": "Amount is required"}), 400
+        result, error = _convert_one(data)
+        if error is not None:
+            return _error_response(error)
 
-        try:
-            amount = float(amount)
-        except (ValueError, TypeError):
-            return jsonify({"error": "Amount must be a valid number"}), 400
+        # Return conversion result
+        return jsonify(result), 200
 
-        if amount < 0:
-            return jsonify({"error": "Amount must be positive"}), 400
+    except Exception as e:
+        logger.error(f"Conversion error: {str(e)}")
+        return _conversion_failed()
 
-        # Validate currencies
-        if not from_currency or not to_currency:
-            return jsonify({"error": "Both from and to currencies are required"}), 400
 
-        if from_currency not in config.SUPPORTED_CURRENCIES:
-            return (
-                jsonify(
-                    {
-                        "error": f"Unsupported source currency: {from_currency}",
-                        "supported_currencies": config.SUPPORTED_CURRENCIES,
-                    }
-                ),
-                400,
-            )
+# Batch currency conversion endpoint
+@app.route("/api/convert/batch", methods=["POST"])
+def convert_batch():
+    """Convert several currency amounts in one request"""
+    try:
+        data, error = _read_json_body()
+        if error is not None:
+            return _error_response(error)
 
-        if to_currency not in config.SUPPORTED_CURRENCIES:
-            return (
-                jsonify(
-                    {
-                        "error": f"Unsupported target currency: {to_currency}",
-                        "supported_currencies": config.SUPPORTED_CURRENCIES,
-                    }
-                ),
-                400,
-            )
+        conversions = data.get("conversions") if isinstance(data, dict) else None
+        if not isinstance(conversions, list):
+            return _error_response(_ERROR_CONVERSIONS_REQUIRED)
 
-        # Get exchange rate
-        exchange_rate = config.EXCHANGE_RATES[from_currency][to_currency]
+        if len(conversions) > config.MAX_BATCH_SIZE:
+            return _error_response(_ERROR_BATCH_TOO_LARGE)
 
-        # Calculate converted amount
-        converted_amount = round(amount * exchange_rate, 2)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Batch conversion request: %d items", len(conversions))
 
-        logger.info(
-            f"Converted {amount} {from_currency} to {converted_amount} {to_currency}"
-        )
+        # Each entry mirrors what /api/convert would return for that item
+        results = []
+        for item in conversions:
+            result, error = _convert_one(item)
+            results.append(error if result is None else result)
 
-        # Return conversion result
-        return (
-            jsonify(
-                {
-                    "success": True,
-                    "original_amount": amount,
-                    "from_currency": from_currency,
-                    "to_currency": to_currency,
-                    "converted_amount": converted_amount,
-                    "exchange_rate": exchange_rate,
-                    "timestamp": datetime.utcnow().isoformat(),
-                }
-            ),
-            200,
-        )
+        return jsonify({"results": results}), 200
 
     except Exception as e:
-        logger.error(f"Conversion error: {str(e)}")
-        return (
-            jsonify(
-                {
-                    "error": "Internal server error",
-                    "message": "An unexpected error occurred during conversion",
-                }
-            ),
-            500,
-        )
+        logger.error(f"Batch conversion error: {str(e)}")
+        return _conversion_failed()
+
+
+# Frontend file locations, resolved once at import time
+_FRONTEND_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "..", "frontend")
+)
+_FRONTEND_INDEX = os.path.join(_FRONTEND_DIR, "index.html")
+_FRONTEND_ASSETS_DIR = os.path.join(_FRONTEND_DIR, "assets")
 
 
 # Frontend serving routes (for containerized deployment)
 @app.route("/")
 def serve_frontend():
     """Serve the main frontend page"""
-    frontend_path = os.path.join(os.path.dirname(__file__), "..", "frontend")
-    return send_file(os.path.join(frontend_path, "index.html"))
+    return send_file(_FRONTEND_INDEX)
 
 
 @app.route("/assets/<path:filename>")
 def serve_assets(filename):
     """Serve frontend assets (CSS, JS, etc.)"""
-    frontend_path = os.path.join(os.path.dirname(__file__), "..", "frontend")
-    return send_from_directory(os.path.join(frontend_path, "assets"), filename)
+    return send_from_directory(_FRONTEND_ASSETS_DIR, filename)
+
+
+# Path prefixes that get JSON 404s instead of the frontend page
+_API_PATH_PREFIXES = ("/api/", "/health")
 
 
 # Error handlers
@@ -259,7 +489,7 @@ def serve_assets(filename):
 def not_found(error):
     """Handle 404 errors"""
     # Check if this is an API request
-    if request.path.startswith("/api/") or request.path.startswith("/health"):
+    if request.path.startswith(_API_PATH_PREFIXES):
         return (
             jsonify(
                 {
@@ -272,8 +502,7 @@ def not_found(error):
     else:
         # For non-API requests, serve the frontend
         try:
-            frontend_path = os.path.join(os.path.dirname(__file__), "..", "frontend")
-            return send_file(os.path.join(frontend_path, "index.html"))
+            return send_file(_FRONTEND_INDEX)
         except:
             return (
                 jsonify(
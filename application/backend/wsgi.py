@@ -0,0 +1,12 @@
+#!/usr/bin/env python3
+"""
+WSGI entrypoint for the Currency Converter API
+Used by gunicorn in production: gunicorn wsgi:application
+"""
+
+from app import app, config, logger
+
+logger.info("Starting Currency Converter API (WSGI worker)")
+logger.info("API Version: %s", config.API_VERSION)
+
+application = app
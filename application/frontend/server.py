@@ -5,7 +5,6 @@ Production-grade static file serving for development/testing
 """
 
 import http.server
-import socketserver
 import os
 import sys
 from pathlib import Path
@@ -16,14 +15,29 @@ from datetime import datetime
 class CORSHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """HTTP Request Handler with CORS support"""
     
+    # MIME types for common frontend file types, keyed by file extension
+    FRONTEND_MIME_TYPES = {
+        '.js': 'application/javascript',
+        '.css': 'text/css',
+        '.html': 'text/html',
+        '.json': 'application/json',
+        '.ico': 'image/x-icon',
+    }
+    
+    # CORS and caching headers added to every response, encoded once
+    EXTRA_HEADERS = (
+        b'Access-Control-Allow-Origin: *\r\n'
+        b'Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n'
+        b'Access-Control-Allow-Headers: Content-Type\r\n'
+        b'Cache-Control: no-cache, no-store, must-revalidate\r\n'
+        b'Pragma: no-cache\r\n'
+        b'Expires: 0\r\n'
+    )
+    
     def end_headers(self):
         """Add CORS headers to all responses"""
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-        self.send_header('Pragma', 'no-cache')
-        self.send_header('Expires', '0')
+        if self.request_version != 'HTTP/0.9':
+            self._headers_buffer.append(self.EXTRA_HEADERS)
         super().end_headers()
     
     def do_OPTIONS(self):
@@ -38,27 +52,11 @@ class CORSHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     
     def guess_type(self, path):
         """Override MIME type guessing for better support"""
-        result = super().guess_type(path)
-        
-        # Handle case where super().guess_type returns just mimetype
-        if isinstance(result, tuple):
-            mimetype, encoding = result
-        else:
-            mimetype, encoding = result, None
-        
-        # Handle common frontend file types
-        if path.endswith('.js'):
-            return 'application/javascript', encoding
-        elif path.endswith('.css'):
-            return 'text/css', encoding
-        elif path.endswith('.html'):
-            return 'text/html', encoding
-        elif path.endswith('.json'):
-            return 'application/json', encoding
-        elif path.endswith('.ico'):
-            return 'image/x-icon', encoding
+        mimetype = self.FRONTEND_MIME_TYPES.get(os.path.splitext(path)[1].lower())
+        if mimetype:
+            return mimetype
         
-        return mimetype, encoding
+        return super().guess_type(path)
 
 def main():
     """Main server function"""
@@ -91,9 +89,9 @@ def main():
             if os.path.isfile(file):
                 print(f"  - {file}")
     
-    # Create server
+    # Create server (one daemon thread per connection, SO_REUSEADDR enabled)
     try:
-        with socketserver.TCPServer((args.host, args.port), CORSHTTPRequestHandler) as httpd:
+        with http.server.ThreadingHTTPServer((args.host, args.port), CORSHTTPRequestHandler) as httpd:
             print(f"\n🚀 Currency Converter Frontend Server")
             print(f"📂 Serving directory: {os.getcwd()}")
             print(f"🌐 Server running at: http://{args.host}:{args.port}")
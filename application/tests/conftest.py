@@ -4,32 +4,176 @@ Pytest configuration and fixtures for Currency Converter tests
 """
 
 import pytest
+import re
+import socket
 import sys
 import os
 
 # Add the backend directory to Python path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
-from app import app, config
+from app import app as flask_app, config
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the Flask application"""
-    app.config['TESTING'] = True
-    app.config['WTF_CSRF_ENABLED'] = False
+def pytest_addoption(parser):
+    """Register the opt-in flag for end-to-end tests against live servers"""
+    parser.addoption('--run-e2e', action='store_true', default=False,
+                     help='run e2e tests that need separately started servers')
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip e2e tests unless --run-e2e was given"""
+    if config.getoption('--run-e2e'):
+        return
+    
+    skip_e2e = pytest.mark.skip(reason='needs --run-e2e')
+    for item in items:
+        if 'e2e' in item.keywords:
+            item.add_marker(skip_e2e)
+
+
+@pytest.fixture(autouse=True)
+def _no_net(request, monkeypatch):
+    """Fail unit tests that try to open a network connection"""
+    if request.node.get_closest_marker('unit') is None:
+        return
     
+    def guard(*args, **kwargs):
+        raise RuntimeError('network access is blocked in unit tests; use the client fixture')
+    
+    monkeypatch.setattr(socket.socket, 'connect', guard)
+    monkeypatch.setattr(socket.socket, 'connect_ex', guard)
+
+
+@pytest.fixture(scope="session", name="app")
+def app_fixture():
+    """The Flask application configured for testing, set up once per session"""
+    flask_app.config['TESTING'] = True
+    flask_app.config['WTF_CSRF_ENABLED'] = False
+    return flask_app
+
+
+@pytest.fixture(scope="session")
+def client(app):
+    """Create a test client for the Flask application, shared by all tests"""
+    # The app context makes response.get_json() decode through app.json (orjson)
     with app.test_client() as client:
         with app.app_context():
             yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def post_convert(client):
+    """POST a JSON payload, or an already-encoded body, to /api/convert"""
+    def post(payload):
+        if isinstance(payload, bytes):
+            return client.post('/api/convert', data=payload, content_type='application/json')
+        return client.post('/api/convert', json=payload)
+    
+    return post
+
+
+@pytest.fixture(scope="session")
+def post_convert_batch(client):
+    """POST a list of conversion payloads to /api/convert/batch"""
+    def post(conversions):
+        return client.post('/api/convert/batch', json={'conversions': conversions})
+    
+    return post
+
+
+@pytest.fixture(scope="session")
+def health_response(client):
+    """GET /health response, fetched once for the read-only field checks"""
+    return client.get('/health')
+
+
+@pytest.fixture(scope="session")
+def health_payload(health_response):
+    """Decoded /health response body"""
+    return health_response.get_json()
+
+
+@pytest.fixture(scope="session")
+def info_response(client):
+    """GET /api/info response, fetched once since the endpoint is static"""
+    return client.get('/api/info')
+
+
+@pytest.fixture(scope="session")
+def info_payload(info_response):
+    """Decoded /api/info response body"""
+    return info_response.get_json()
+
+
+@pytest.fixture(scope="session")
+def rates_response(client):
+    """GET /api/rates response for the default base currency, fetched once"""
+    return client.get('/api/rates')
+
+
+@pytest.fixture(scope="session")
+def rates_payload(rates_response):
+    """Decoded /api/rates response body"""
+    return rates_response.get_json()
+
+
+@pytest.fixture(scope="class")
+def endpoint_bundle(client):
+    """Decoded bodies of the read-only endpoints, fetched once per test class"""
+    return {
+        'health': client.get('/health').get_json(),
+        'info': client.get('/api/info').get_json(),
+        'rates_usd': client.get('/api/rates?base=USD').get_json(),
+    }
+
+
+@pytest.fixture(scope="session")
 def app_config():
     """Provide access to application configuration"""
     return config
 
 
+@pytest.fixture(scope="session")
+def supported_currencies(app_config):
+    """Supported currency codes in configured order, bound once per session"""
+    return tuple(app_config.SUPPORTED_CURRENCIES)
+
+
+@pytest.fixture(scope="session")
+def supported_currency_set(supported_currencies):
+    """Supported currency codes as a frozenset for set-based assertions"""
+    return frozenset(supported_currencies)
+
+
+@pytest.fixture(params=config.SUPPORTED_CURRENCIES)
+def base_currency(request):
+    """Each supported currency code in turn, for tests that run once per currency"""
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def iso_timestamp_re():
+    """ISO-8601 timestamp, optionally with fractional seconds and a UTC offset"""
+    return re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?(Z|[+-]\d{2}:?\d{2})?$')
+
+
+@pytest.fixture(scope="session")
+def live_servers():
+    """Base URLs of the separately started backend and frontend, probed once per session"""
+    servers = {
+        'backend': ('127.0.0.1', 5004),
+        'frontend': ('127.0.0.1', 8082),
+    }
+    for name, address in servers.items():
+        try:
+            socket.create_connection(address, timeout=0.5).close()
+        except OSError:
+            pytest.skip(f"{name} server not listening on {address[0]}:{address[1]}")
+    
+    return {name: f'http://{host}:{port}' for name, (host, port) in servers.items()}
+
+
 @pytest.fixture
 def sample_conversion_data():
     """Sample data for currency conversion tests"""
@@ -57,9 +201,9 @@ def sample_conversion_data():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_conversion_data():
-    """Invalid data for error testing"""
+    """Invalid data for error testing, shared read-only across the session"""
     return {
         'missing_amount': {
             'from': 'USD',
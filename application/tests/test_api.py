@@ -1,64 +1,36 @@
 #!/usr/bin/env python3
 """
 Simple test script to verify Flask API is working
+Run manually against a local server: python test_api.py
 """
 
+import sys
 import requests
-import json
 
-# Test health endpoint
-print("Testing /health endpoint...")
-try:
-    response = requests.get('http://localhost:3000/health')
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {response.json()}")
-    print()
-except Exception as e:
-    print(f"Error: {e}")
-    print()
+BASE_URL = 'http://localhost:3000'
 
-# Test conversion endpoint
-print("Testing /convert endpoint...")
-try:
-    data = {
-        "amount": 100,
-        "from": "USD",
-        "to": "EUR"
-    }
-    response = requests.post('http://localhost:3000/convert', json=data)
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {response.json()}")
-    print()
-except Exception as e:
-    print(f"Error: {e}")
-    print()
+# (label, method, path, JSON payload)
+CHECKS = [
+    ("GET /health", "get", "/health", None),
+    ("POST /api/convert USD->EUR", "post", "/api/convert", {"amount": 100, "from": "USD", "to": "EUR"}),
+    ("POST /api/convert GBP->JPY", "post", "/api/convert", {"amount": 50, "from": "GBP", "to": "JPY"}),
+    ("POST /api/convert USD->INR (unsupported)", "post", "/api/convert", {"amount": 100, "from": "USD", "to": "INR"}),
+]
 
-# Test another conversion
-print("Testing /convert endpoint (GBP to JPY)...")
-try:
-    data = {
-        "amount": 50,
-        "from": "GBP", 
-        "to": "JPY"
-    }
-    response = requests.post('http://localhost:3000/convert', json=data)
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {response.json()}")
-    print()
-except Exception as e:
-    print(f"Error: {e}")
-    print()
 
-# Test error case
-print("Testing error case (invalid currency)...")
-try:
-    data = {
-        "amount": 100,
-        "from": "USD",
-        "to": "INR"  # Not supported
-    }
-    response = requests.post('http://localhost:3000/convert', json=data)
-    print(f"Status Code: {response.status_code}")
-    print(f"Response: {response.json()}")
-except Exception as e:
-    print(f"Error: {e}")
\ No newline at end of file
+def main():
+    """Run each check and write one summary line per endpoint in a single write"""
+    lines = []
+    with requests.Session() as session:
+        for label, method, path, payload in CHECKS:
+            try:
+                response = session.request(method, f"{BASE_URL}{path}", json=payload, timeout=5)
+                lines.append(f"{label}: {response.status_code} {response.json()}")
+            except Exception as e:
+                lines.append(f"{label}: error: {e}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+if __name__ == '__main__':
+    main()
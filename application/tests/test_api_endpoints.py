@@ -3,9 +3,14 @@
 Unit tests for additional API endpoints (/api/rates, /api/info)
 """
 
+import logging
+import os
+import subprocess
+import sys
+
 import pytest
-import json
-from datetime import datetime
+
+from app import OrjsonProvider
 
 
 @pytest.mark.unit
@@ -13,12 +18,10 @@ from datetime import datetime
 class TestRatesEndpoint:
     """Test cases for the /api/rates endpoint"""
     
-    def test_rates_endpoint_default_base_currency(self, client, app_config):
+    def test_rates_endpoint_default_base_currency(self, rates_response, rates_payload, supported_currency_set):
         """Test rates endpoint with default base currency (USD)"""
-        response = client.get('/api/rates')
-        
-        assert response.status_code == 200
-        data = response.get_json()
+        assert rates_response.status_code == 200
+        data = rates_payload
         
         # Check response structure
         required_fields = ['base_currency', 'rates', 'timestamp']
@@ -29,25 +32,23 @@ class TestRatesEndpoint:
         assert data['base_currency'] == 'USD'
         
         # Check rates structure
-        assert isinstance(data['rates'], dict)
-        for currency in app_config.SUPPORTED_CURRENCIES:
-            assert currency in data['rates']
-            assert isinstance(data['rates'][currency], (int, float))
-            assert data['rates'][currency] > 0
+        rates = data['rates']
+        assert isinstance(rates, dict)
+        assert supported_currency_set <= rates.keys()
+        assert all(isinstance(rate, (int, float)) and rate > 0 for rate in rates.values())
     
-    def test_rates_endpoint_specific_base_currency(self, client, app_config):
+    def test_rates_endpoint_specific_base_currency(self, client, base_currency):
         """Test rates endpoint with specific base currency"""
-        for base_currency in app_config.SUPPORTED_CURRENCIES:
-            response = client.get(f'/api/rates?base={base_currency}')
-            
-            assert response.status_code == 200, f"Failed for base currency {base_currency}"
-            data = response.get_json()
-            
-            assert data['base_currency'] == base_currency
-            assert isinstance(data['rates'], dict)
-            
-            # Base currency should have rate of 1.0 to itself
-            assert data['rates'][base_currency] == 1.0
+        response = client.get(f'/api/rates?base={base_currency}')
+        
+        assert response.status_code == 200, f"Failed for base currency {base_currency}"
+        data = response.get_json()
+        
+        assert data['base_currency'] == base_currency
+        assert isinstance(data['rates'], dict)
+        
+        # Base currency should have rate of 1.0 to itself
+        assert data['rates'][base_currency] == 1.0
     
     def test_rates_endpoint_case_insensitive_base(self, client):
         """Test that base currency parameter is case insensitive"""
@@ -73,17 +74,10 @@ class TestRatesEndpoint:
         assert 'supported_currencies' in data
         assert 'INR' in data['error']
     
-    def test_rates_endpoint_timestamp_format(self, client):
+    def test_rates_endpoint_timestamp_format(self, rates_payload, iso_timestamp_re):
         """Test that rates response includes valid timestamp"""
-        response = client.get('/api/rates')
-        data = response.get_json()
-        
-        timestamp_str = data['timestamp']
-        try:
-            parsed_timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            assert isinstance(parsed_timestamp, datetime)
-        except ValueError:
-            pytest.fail(f"Invalid timestamp format: {timestamp_str}")
+        timestamp_str = rates_payload['timestamp']
+        assert iso_timestamp_re.match(timestamp_str), f"Invalid timestamp format: {timestamp_str}"
     
     def test_rates_endpoint_wrong_method(self, client):
         """Test that non-GET methods return 405 Method Not Allowed"""
@@ -99,7 +93,7 @@ class TestRatesEndpoint:
         response = client.delete('/api/rates')
         assert response.status_code == 405
     
-    def test_rates_endpoint_rates_consistency(self, client, app_config):
+    def test_rates_endpoint_rates_consistency(self, client):
         """Test that exchange rates are consistent across calls"""
         response1 = client.get('/api/rates?base=USD')
         response2 = client.get('/api/rates?base=USD')
@@ -110,6 +104,17 @@ class TestRatesEndpoint:
         # Rates should be identical
         assert data1['rates'] == data2['rates']
         assert data1['base_currency'] == data2['base_currency']
+    
+    def test_rates_endpoint_cache_headers(self, client, app_config):
+        """Test that rates responses are cacheable by clients and proxies"""
+        response = client.get('/api/rates?base=EUR')
+        
+        assert response.cache_control.public
+        assert response.cache_control.max_age == app_config.RATES_CACHE_MAX_AGE
+        
+        # Error responses must not be cached
+        response = client.get('/api/rates?base=INR')
+        assert 'Cache-Control' not in response.headers
 
 
 @pytest.mark.unit
@@ -117,32 +122,26 @@ class TestRatesEndpoint:
 class TestInfoEndpoint:
     """Test cases for the /api/info endpoint"""
     
-    def test_info_endpoint_returns_200(self, client):
+    def test_info_endpoint_returns_200(self, info_response):
         """Test that info endpoint returns 200 status code"""
-        response = client.get('/api/info')
-        assert response.status_code == 200
+        assert info_response.status_code == 200
     
-    def test_info_endpoint_returns_json(self, client):
+    def test_info_endpoint_returns_json(self, info_response, info_payload):
         """Test that info endpoint returns valid JSON"""
-        response = client.get('/api/info')
-        assert response.content_type == 'application/json'
-        
-        data = response.get_json()
-        assert data is not None
+        assert info_response.content_type == 'application/json'
+        assert info_payload is not None
     
-    def test_info_endpoint_contains_required_fields(self, client):
+    def test_info_endpoint_contains_required_fields(self, info_payload):
         """Test that info response contains all required fields"""
-        response = client.get('/api/info')
-        data = response.get_json()
+        data = info_payload
         
         required_fields = ['name', 'version', 'endpoints', 'supported_currencies']
         for field in required_fields:
             assert field in data, f"Required field '{field}' missing from info response"
     
-    def test_info_endpoint_name_and_version(self, client, app_config):
+    def test_info_endpoint_name_and_version(self, info_payload, app_config):
         """Test that info endpoint returns correct name and version"""
-        response = client.get('/api/info')
-        data = response.get_json()
+        data = info_payload
         
         assert isinstance(data['name'], str)
         assert len(data['name']) > 0
@@ -150,27 +149,21 @@ class TestInfoEndpoint:
         
         assert data['version'] == app_config.API_VERSION
     
-    def test_info_endpoint_endpoints_structure(self, client):
+    def test_info_endpoint_endpoints_structure(self, info_payload):
         """Test that endpoints field contains expected endpoint information"""
-        response = client.get('/api/info')
-        data = response.get_json()
-        
-        endpoints = data['endpoints']
+        endpoints = info_payload['endpoints']
         assert isinstance(endpoints, dict)
         
         # Check for expected endpoints
-        expected_endpoints = ['health', 'convert', 'rates']
-        for endpoint in expected_endpoints:
-            assert endpoint in endpoints, f"Expected endpoint '{endpoint}' not found in info"
-            assert isinstance(endpoints[endpoint], str)
-            assert len(endpoints[endpoint]) > 0
+        missing = {'health', 'convert', 'convert_batch', 'rates'} - endpoints.keys()
+        assert not missing, f"Expected endpoints not found in info: {missing}"
+        assert all(isinstance(route, str) and route for route in endpoints.values())
     
-    def test_info_endpoint_supported_currencies(self, client, app_config):
+    def test_info_endpoint_supported_currencies(self, info_payload, supported_currencies):
         """Test that info endpoint returns correct supported currencies"""
-        response = client.get('/api/info')
-        data = response.get_json()
+        data = info_payload
         
-        assert data['supported_currencies'] == app_config.SUPPORTED_CURRENCIES
+        assert tuple(data['supported_currencies']) == supported_currencies
         assert isinstance(data['supported_currencies'], list)
         assert len(data['supported_currencies']) > 0
     
@@ -198,6 +191,11 @@ class TestInfoEndpoint:
         
         # All fields should be identical
         assert data1 == data2
+    
+    def test_info_endpoint_cache_headers(self, info_response, app_config):
+        """Test that info responses are cacheable by clients and proxies"""
+        assert info_response.cache_control.public
+        assert info_response.cache_control.max_age == app_config.INFO_CACHE_MAX_AGE
 
 
 @pytest.mark.unit
@@ -248,43 +246,68 @@ class TestErrorHandling:
 class TestCrossEndpointConsistency:
     """Test consistency across different API endpoints"""
     
-    def test_supported_currencies_consistency(self, client):
+    def test_supported_currencies_consistency(self, endpoint_bundle):
         """Test that supported currencies are consistent across all endpoints"""
-        # Get supported currencies from different endpoints
-        health_response = client.get('/health')
-        info_response = client.get('/api/info')
-        
-        health_data = health_response.get_json()
-        info_data = info_response.get_json()
+        health_data = endpoint_bundle['health']
+        info_data = endpoint_bundle['info']
         
         # Should be identical
         assert health_data['supported_currencies'] == info_data['supported_currencies']
     
-    def test_version_consistency(self, client):
+    def test_version_consistency(self, endpoint_bundle):
         """Test that API version is consistent across endpoints"""
-        health_response = client.get('/health')
-        info_response = client.get('/api/info')
-        
-        health_data = health_response.get_json()
-        info_data = info_response.get_json()
+        health_data = endpoint_bundle['health']
+        info_data = endpoint_bundle['info']
         
         assert health_data['version'] == info_data['version']
     
-    def test_exchange_rates_consistency(self, client, app_config):
+    def test_exchange_rates_consistency(self, post_convert, endpoint_bundle):
         """Test that exchange rates used in conversion match rates endpoint"""
         # Get rates from rates endpoint
-        rates_response = client.get('/api/rates?base=USD')
-        rates_data = rates_response.get_json()
+        rates_data = endpoint_bundle['rates_usd']
         
         # Test conversion using the same rates
         conversion_data = {'amount': 100, 'from': 'USD', 'to': 'EUR'}
-        convert_response = client.post('/api/convert',
-                                     data=json.dumps(conversion_data),
-                                     content_type='application/json')
+        convert_response = post_convert(conversion_data)
         convert_data = convert_response.get_json()
         
         # Exchange rate should match
         expected_rate = rates_data['rates']['EUR']
         actual_rate = convert_data['exchange_rate']
         
-        assert expected_rate == actual_rate
\ No newline at end of file
+        assert expected_rate == actual_rate
+
+
+@pytest.mark.unit
+class TestJsonProvider:
+    """Test cases for the orjson-backed JSON provider"""
+    
+    def test_app_uses_orjson_provider(self, app):
+        """Test that the app serializes with orjson when it is installed"""
+        pytest.importorskip('orjson')
+        assert isinstance(app.json, OrjsonProvider)
+    
+    def test_provider_round_trip(self, app):
+        """Test that the provider encodes and decodes payloads losslessly"""
+        payload = {'amount': 123.45, 'currencies': ['USD', 'EUR'], 'symbol': '€', 'ok': True}
+        
+        assert app.json.loads(app.json.dumps(payload)) == payload
+        assert app.json.response(payload).get_json() == payload
+
+
+@pytest.mark.unit
+class TestLoggingConfig:
+    """Test cases for the LOG_LEVEL environment setting"""
+    
+    def test_unknown_log_level_falls_back_to_info(self):
+        """Test that an invalid LOG_LEVEL warns and keeps INFO instead of failing the import"""
+        backend_dir = os.path.join(os.path.dirname(__file__), '..', 'backend')
+        result = subprocess.run(
+            [sys.executable, '-c', 'import app; print(app.logger.getEffectiveLevel())'],
+            cwd=backend_dir, env={**os.environ, 'LOG_LEVEL': 'verbose'},
+            capture_output=True, text=True, timeout=10,
+        )
+        
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.strip() == str(logging.INFO)
+        assert "Unknown LOG_LEVEL 'VERBOSE'" in result.stderr
@@ -4,8 +4,10 @@ Unit tests for the /api/convert endpoint
 """
 
 import pytest
-import json
-from datetime import datetime
+from flask.json.provider import DefaultJSONProvider
+
+# Malformed request body, kept as raw bytes since it cannot be sent via json=
+INVALID_JSON_BODY = b'{"invalid": json}'
 
 
 @pytest.mark.unit
@@ -13,12 +15,10 @@ from datetime import datetime
 class TestConvertEndpoint:
     """Test cases for the currency conversion endpoint"""
     
-    def test_convert_endpoint_valid_conversion(self, client, sample_conversion_data):
+    def test_convert_endpoint_valid_conversion(self, post_convert, sample_conversion_data):
         """Test successful currency conversion with valid data"""
         data = sample_conversion_data['valid_conversion']
-        response = client.post('/api/convert', 
-                             data=json.dumps(data),
-                             content_type='application/json')
+        response = post_convert(data)
         
         assert response.status_code == 200
         result = response.get_json()
@@ -39,12 +39,10 @@ class TestConvertEndpoint:
         assert result['converted_amount'] > 0
         assert result['exchange_rate'] > 0
     
-    def test_convert_endpoint_same_currency(self, client, sample_conversion_data):
+    def test_convert_endpoint_same_currency(self, post_convert, sample_conversion_data):
         """Test conversion between same currencies (should return same amount)"""
         data = sample_conversion_data['same_currency']
-        response = client.post('/api/convert',
-                             data=json.dumps(data),
-                             content_type='application/json')
+        response = post_convert(data)
         
         assert response.status_code == 200
         result = response.get_json()
@@ -54,12 +52,10 @@ class TestConvertEndpoint:
         assert result['exchange_rate'] == 1.0
         assert result['from_currency'] == result['to_currency']
     
-    def test_convert_endpoint_decimal_amount(self, client, sample_conversion_data):
+    def test_convert_endpoint_decimal_amount(self, post_convert, sample_conversion_data):
         """Test conversion with decimal amounts"""
         data = sample_conversion_data['decimal_amount']
-        response = client.post('/api/convert',
-                             data=json.dumps(data),
-                             content_type='application/json')
+        response = post_convert(data)
         
         assert response.status_code == 200
         result = response.get_json()
@@ -69,12 +65,10 @@ class TestConvertEndpoint:
         # Converted amount should be rounded to 2 decimal places
         assert round(result['converted_amount'], 2) == result['converted_amount']
     
-    def test_convert_endpoint_zero_amount(self, client, sample_conversion_data):
+    def test_convert_endpoint_zero_amount(self, post_convert, sample_conversion_data):
         """Test conversion with zero amount"""
         data = sample_conversion_data['zero_amount']
-        response = client.post('/api/convert',
-                             data=json.dumps(data),
-                             content_type='application/json')
+        response = post_convert(data)
         
         assert response.status_code == 200
         result = response.get_json()
@@ -83,13 +77,11 @@ class TestConvertEndpoint:
         assert result['original_amount'] == 0.0
         assert result['converted_amount'] == 0.0
     
-    def test_convert_endpoint_calculation_accuracy(self, client, app_config):
+    def test_convert_endpoint_calculation_accuracy(self, post_convert, app_config):
         """Test that conversion calculations are accurate"""
         # Test known conversion: 100 USD to EUR
         data = {'amount': 100, 'from': 'USD', 'to': 'EUR'}
-        response = client.post('/api/convert',
-                             data=json.dumps(data),
-                             content_type='application/json')
+        response = post_convert(data)
         
         result = response.get_json()
         expected_rate = app_config.EXCHANGE_RATES['USD']['EUR']
@@ -98,109 +90,81 @@ class TestConvertEndpoint:
         assert result['exchange_rate'] == expected_rate
         assert result['converted_amount'] == expected_amount
     
-    def test_convert_endpoint_timestamp_format(self, client, sample_conversion_data):
+    def test_convert_endpoint_timestamp_format(self, post_convert, sample_conversion_data, iso_timestamp_re):
         """Test that conversion response includes valid timestamp"""
         data = sample_conversion_data['valid_conversion']
-        response = client.post('/api/convert',
-                             data=json.dumps(data),
-                             content_type='application/json')
+        response = post_convert(data)
         
         result = response.get_json()
         timestamp_str = result['timestamp']
         
-        # Should be able to parse the timestamp
-        try:
-            parsed_timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            assert isinstance(parsed_timestamp, datetime)
-        except ValueError:
-            pytest.fail(f"Invalid timestamp format: {timestamp_str}")
+        assert iso_timestamp_re.match(timestamp_str), f"Invalid timestamp format: {timestamp_str}"
     
-    def test_convert_endpoint_missing_amount(self, client, invalid_conversion_data):
-        """Test error handling for missing amount"""
-        data = invalid_conversion_data['missing_amount']
-        response = client.post('/api/convert',
-                             data=json.dumps(data),
-                             content_type='application/json')
+    def test_convert_endpoint_numeric_string_amount(self, post_convert):
+        """Test that numeric strings are accepted as amounts"""
+        data = {'amount': '100', 'from': 'USD', 'to': 'EUR'}
+        response = post_convert(data)
         
-        assert response.status_code == 400
-        result = response.get_json()
-        assert 'error' in result
-        assert 'amount' in result['error'].lower()
+        assert response.status_code == 200
+        assert response.get_json()['original_amount'] == 100.0
     
-    def test_convert_endpoint_negative_amount(self, client, invalid_conversion_data):
-        """Test error handling for negative amount"""
-        data = invalid_conversion_data['negative_amount']
-        response = client.post('/api/convert',
-                             data=json.dumps(data),
-                             content_type='application/json')
+    def test_convert_endpoint_boolean_amount(self, post_convert):
+        """Test that JSON booleans are rejected as amounts"""
+        data = {'amount': True, 'from': 'USD', 'to': 'EUR'}
+        response = post_convert(data)
         
         assert response.status_code == 400
-        result = response.get_json()
-        assert 'error' in result
-        assert 'positive' in result['error'].lower()
+        assert 'number' in response.get_json()['error'].lower()
     
-    def test_convert_endpoint_invalid_amount(self, client, invalid_conversion_data):
-        """Test error handling for non-numeric amount"""
-        data = invalid_conversion_data['invalid_amount']
-        response = client.post('/api/convert',
-                             data=json.dumps(data),
-                             content_type='application/json')
+    @pytest.mark.parametrize('amount', ['nan', 'inf', '-inf', '1e400'])
+    def test_convert_endpoint_non_finite_amount(self, post_convert, amount):
+        """Test that strings parsing to NaN or infinity are rejected as amounts"""
+        data = {'amount': amount, 'from': 'USD', 'to': 'EUR'}
+        response = post_convert(data)
         
         assert response.status_code == 400
-        result = response.get_json()
-        assert 'error' in result
-        assert 'number' in result['error'].lower()
+        assert 'number' in response.get_json()['error'].lower()
     
-    def test_convert_endpoint_missing_currencies(self, client, invalid_conversion_data):
-        """Test error handling for missing currency fields"""
-        # Test missing from currency
-        data = invalid_conversion_data['missing_from_currency']
-        response = client.post('/api/convert',
-                             data=json.dumps(data),
-                             content_type='application/json')
-        assert response.status_code == 400
+    def test_convert_endpoint_overflowing_integer_amount(self, app, post_convert, post_convert_batch, monkeypatch):
+        """Test that integers too large for a float are rejected, not a 500, under stdlib JSON decoding"""
+        # orjson refuses such literals outright; the stdlib provider decodes them to int
+        monkeypatch.setattr(app, 'json', DefaultJSONProvider(app))
+        amount = 10 ** 400
         
-        # Test missing to currency
-        data = invalid_conversion_data['missing_to_currency']
-        response = client.post('/api/convert',
-                             data=json.dumps(data),
-                             content_type='application/json')
+        response = post_convert({'amount': amount, 'from': 'USD', 'to': 'EUR'})
         assert response.status_code == 400
-    
-    def test_convert_endpoint_unsupported_currencies(self, client, invalid_conversion_data):
-        """Test error handling for unsupported currencies"""
-        # Test unsupported from currency
-        data = invalid_conversion_data['unsupported_from_currency']
-        response = client.post('/api/convert',
-                             data=json.dumps(data),
-                             content_type='application/json')
+        assert 'number' in response.get_json()['error'].lower()
         
-        assert response.status_code == 400
-        result = response.get_json()
-        assert 'error' in result
-        assert 'supported_currencies' in result
-        
-        # Test unsupported to currency
-        data = invalid_conversion_data['unsupported_to_currency']
-        response = client.post('/api/convert',
-                             data=json.dumps(data),
-                             content_type='application/json')
+        response = post_convert_batch([{'amount': 100, 'from': 'USD', 'to': 'EUR'},
+                                       {'amount': amount, 'from': 'USD', 'to': 'EUR'}])
+        assert response.status_code == 200
+        results = response.get_json()['results']
+        assert results[0]['success'] is True
+        assert 'number' in results[1]['error'].lower()
+    
+    @pytest.mark.parametrize('case,expected_error', [
+        ('missing_amount', 'amount is required'),
+        ('negative_amount', 'positive'),
+        ('invalid_amount', 'valid number'),
+        ('missing_from_currency', 'currencies are required'),
+        ('missing_to_currency', 'currencies are required'),
+        ('empty_currencies', 'currencies are required'),
+        ('unsupported_from_currency', 'unsupported source currency'),
+        ('unsupported_to_currency', 'unsupported target currency'),
+    ])
+    def test_convert_endpoint_invalid_request(self, post_convert, invalid_conversion_data, case, expected_error):
+        """Test that each invalid request is rejected with a matching error message"""
+        response = post_convert(invalid_conversion_data[case])
         
         assert response.status_code == 400
-        result = response.get_json()
-        assert 'error' in result
-        assert 'supported_currencies' in result
+        assert expected_error in response.get_json()['error'].lower()
     
-    def test_convert_endpoint_empty_currencies(self, client, invalid_conversion_data):
-        """Test error handling for empty currency strings"""
-        data = invalid_conversion_data['empty_currencies']
-        response = client.post('/api/convert',
-                             data=json.dumps(data),
-                             content_type='application/json')
+    def test_convert_endpoint_unsupported_currency_lists_supported(self, post_convert, invalid_conversion_data, supported_currencies):
+        """Test that unsupported currency errors tell the client what is supported"""
+        response = post_convert(invalid_conversion_data['unsupported_to_currency'])
         
         assert response.status_code == 400
-        result = response.get_json()
-        assert 'error' in result
+        assert tuple(response.get_json()['supported_currencies']) == supported_currencies
     
     def test_convert_endpoint_no_json_data(self, client):
         """Test error handling when no JSON data is provided"""
@@ -211,11 +175,9 @@ class TestConvertEndpoint:
         assert 'error' in result
         assert 'json' in result['error'].lower()
     
-    def test_convert_endpoint_invalid_json(self, client):
+    def test_convert_endpoint_invalid_json(self, post_convert):
         """Test error handling for malformed JSON"""
-        response = client.post('/api/convert',
-                             data='{"invalid": json}',
-                             content_type='application/json')
+        response = post_convert(INVALID_JSON_BODY)
         
         assert response.status_code == 400
     
@@ -233,13 +195,11 @@ class TestConvertEndpoint:
         response = client.delete('/api/convert')
         assert response.status_code == 405
     
-    def test_convert_endpoint_case_insensitive_currencies(self, client):
+    def test_convert_endpoint_case_insensitive_currencies(self, post_convert):
         """Test that currency codes are case insensitive"""
         # Test lowercase currencies
         data = {'amount': 100, 'from': 'usd', 'to': 'eur'}
-        response = client.post('/api/convert',
-                             data=json.dumps(data),
-                             content_type='application/json')
+        response = post_convert(data)
         
         assert response.status_code == 200
         result = response.get_json()
@@ -248,26 +208,89 @@ class TestConvertEndpoint:
         
         # Test mixed case currencies
         data = {'amount': 100, 'from': 'Gbp', 'to': 'JpY'}
-        response = client.post('/api/convert',
-                             data=json.dumps(data),
-                             content_type='application/json')
+        response = post_convert(data)
         
         assert response.status_code == 200
         result = response.get_json()
         assert result['from_currency'] == 'GBP'
         assert result['to_currency'] == 'JPY'
     
-    def test_convert_endpoint_all_currency_pairs(self, client, app_config):
-        """Test conversion between all supported currency pairs"""
-        for from_currency in app_config.SUPPORTED_CURRENCIES:
-            for to_currency in app_config.SUPPORTED_CURRENCIES:
-                data = {'amount': 100, 'from': from_currency, 'to': to_currency}
-                response = client.post('/api/convert',
-                                     data=json.dumps(data),
-                                     content_type='application/json')
-                
-                assert response.status_code == 200, f"Failed for {from_currency} to {to_currency}"
-                result = response.get_json()
-                assert result['success'] is True
-                assert result['from_currency'] == from_currency
-                assert result['to_currency'] == to_currency
\ No newline at end of file
+    def test_convert_endpoint_all_currency_pairs(self, post_convert_batch, supported_currencies):
+        """Test conversion between all supported currency pairs in one batch request"""
+        pairs = [(f, t) for f in supported_currencies for t in supported_currencies]
+        response = post_convert_batch([{'amount': 100, 'from': f, 'to': t} for f, t in pairs])
+        
+        assert response.status_code == 200
+        results = response.get_json()['results']
+        assert len(results) == len(pairs)
+        for (from_currency, to_currency), result in zip(pairs, results):
+            assert result.get('success') is True, f"Failed for {from_currency} to {to_currency}"
+            assert result['from_currency'] == from_currency
+            assert result['to_currency'] == to_currency
+
+
+@pytest.mark.unit
+@pytest.mark.api
+class TestConvertBatchEndpoint:
+    """Test cases for the batch currency conversion endpoint"""
+    
+    def test_batch_matches_single_conversion(self, post_convert, post_convert_batch, sample_conversion_data):
+        """Test that a batch item converts exactly like /api/convert"""
+        data = sample_conversion_data['valid_conversion']
+        single = post_convert(data).get_json()
+        batch = post_convert_batch([data]).get_json()['results'][0]
+        
+        for field in ('original_amount', 'from_currency', 'to_currency', 'converted_amount', 'exchange_rate'):
+            assert batch[field] == single[field]
+    
+    def test_batch_reports_item_errors_in_place(self, post_convert_batch, sample_conversion_data, invalid_conversion_data):
+        """Test that an invalid item yields its error without failing the batch"""
+        response = post_convert_batch([
+            sample_conversion_data['valid_conversion'],
+            invalid_conversion_data['negative_amount'],
+            'not an object',
+        ])
+        
+        assert response.status_code == 200
+        results = response.get_json()['results']
+        assert results[0]['success'] is True
+        assert results[1]['error'] == 'Amount must be positive'
+        assert 'error' in results[2]
+    
+    @pytest.mark.parametrize('currency', [5, None, ['USD'], {'code': 'USD'}])
+    def test_batch_non_string_currency(self, post_convert_batch, sample_conversion_data, currency):
+        """Test that a non-string currency fails only its own item"""
+        response = post_convert_batch([
+            sample_conversion_data['valid_conversion'],
+            {'amount': 1, 'from': currency, 'to': 'EUR'},
+            {'amount': 1, 'from': 'USD', 'to': currency},
+        ])
+        
+        assert response.status_code == 200
+        results = response.get_json()['results']
+        assert results[0]['success'] is True
+        assert 'currencies are required' in results[1]['error']
+        assert 'currencies are required' in results[2]['error']
+    
+    def test_batch_empty_item(self, post_convert_batch):
+        """Test that an empty item gets an item-level error rather than a missing-body one"""
+        response = post_convert_batch([{}, None])
+        
+        assert response.status_code == 200
+        results = response.get_json()['results']
+        assert results[0]['error'] == 'Amount is required'
+        assert results[1]['error'] == 'Conversion request must be a JSON object'
+    
+    def test_batch_requires_conversion_list(self, client):
+        """Test that the conversions field must be a list"""
+        response = client.post('/api/convert/batch', json={'amount': 100, 'from': 'USD', 'to': 'EUR'})
+        
+        assert response.status_code == 400
+        assert 'error' in response.get_json()
+    
+    def test_batch_size_limit(self, post_convert_batch, sample_conversion_data, app_config):
+        """Test that oversized batches are rejected"""
+        response = post_convert_batch([sample_conversion_data['valid_conversion']] * (app_config.MAX_BATCH_SIZE + 1))
+        
+        assert response.status_code == 400
+        assert 'error' in response.get_json()
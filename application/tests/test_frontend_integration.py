@@ -3,92 +3,80 @@
 Integration test to verify frontend and backend work together
 """
 
-import requests
-import re
-
-# Test configuration
-BASE_URL = 'http://localhost:5001'
-
-def test_frontend_integration():
-    """Test complete frontend and backend integration"""
-    
-    print("=== Frontend and Backend Integration Test ===\n")
-    
-    # Test 1: Frontend HTML is served
-    print("1. Testing frontend HTML delivery...")
-    try:
-        response = requests.get(f'{BASE_URL}/')
-        if response.status_code == 200 and 'Currency Converter' in response.text:
-            print("✅ Frontend HTML served successfully")
-        else:
-            print(f"❌ Frontend HTML test failed: {response.status_code}")
-            return False
-    except Exception as e:
-        print(f"❌ Frontend HTML test error: {e}")
-        return False
-    
-    # Test 2: Static CSS file is accessible
-    print("\n2. Testing static CSS file...")
-    try:
-        css_response = requests.get(f'{BASE_URL}/static/css/style.css')
-        if css_response.status_code == 200 and 'Currency Converter Styles' in css_response.text:
-            print("✅ CSS file served successfully")
-        else:
-            print(f"❌ CSS file test failed: {css_response.status_code}")
-    except Exception as e:
-        print(f"❌ CSS file test error: {e}")
-    
-    # Test 3: Static JS file is accessible  
-    print("\n3. Testing static JavaScript file...")
-    try:
-        js_response = requests.get(f'{BASE_URL}/static/js/app.js')
-        if js_response.status_code == 200 and 'handleConversion' in js_response.text:
-            print("✅ JavaScript file served successfully")
-        else:
-            print(f"❌ JavaScript file test failed: {js_response.status_code}")
-    except Exception as e:
-        print(f"❌ JavaScript file test error: {e}")
-    
-    # Test 4: Health endpoint accessible from frontend
-    print("\n4. Testing health endpoint...")
-    try:
-        health_response = requests.get(f'{BASE_URL}/health')
-        if health_response.status_code == 200:
-            health_data = health_response.json()
-            print(f"✅ Health endpoint working: {health_data['status']}")
-        else:
-            print(f"❌ Health endpoint failed: {health_response.status_code}")
-    except Exception as e:
-        print(f"❌ Health endpoint error: {e}")
-    
-    # Test 5: Conversion endpoint works
-    print("\n5. Testing conversion endpoint...")
-    try:
-        convert_data = {"amount": 150, "from": "GBP", "to": "JPY"}
-        convert_response = requests.post(f'{BASE_URL}/convert', json=convert_data)
-        if convert_response.status_code == 200:
-            result = convert_response.json()
-            print(f"✅ Conversion successful: {result['original_amount']} {result['from_currency']} = {result['converted_amount']} {result['to_currency']}")
-        else:
-            print(f"❌ Conversion failed: {convert_response.status_code}")
-    except Exception as e:
-        print(f"❌ Conversion test error: {e}")
-    
-    # Test 6: Error handling works
-    print("\n6. Testing error handling...")
-    try:
-        error_data = {"amount": 100, "from": "USD", "to": "INVALID"}
-        error_response = requests.post(f'{BASE_URL}/convert', json=error_data)
-        if error_response.status_code == 400:
-            error_result = error_response.json()
-            print(f"✅ Error handling works: {error_result['error']}")
-        else:
-            print(f"❌ Error handling test failed: {error_response.status_code}")
-    except Exception as e:
-        print(f"❌ Error handling test error: {e}")
-    
-    print("\n=== Integration Test Complete ===")
-    return True
-
-if __name__ == '__main__':
-    test_frontend_integration()
\ No newline at end of file
+import pytest
+
+pytestmark = pytest.mark.integration
+
+
+def test_frontend_html_served(client):
+    """Test that the frontend HTML is served"""
+    response = client.get('/')
+
+    assert response.status_code == 200
+    assert 'Currency Converter' in response.get_data(as_text=True)
+
+
+def test_frontend_css_served(client):
+    """Test that the static CSS file is accessible"""
+    response = client.get('/assets/css/style.css')
+
+    assert response.status_code == 200
+    assert 'Currency Converter Styles' in response.get_data(as_text=True)
+
+
+def test_frontend_js_served(client):
+    """Test that the static JavaScript file is accessible"""
+    response = client.get('/assets/js/app.js')
+
+    assert response.status_code == 200
+    assert 'handleConversion' in response.get_data(as_text=True)
+
+
+def test_frontend_config_served(client):
+    """Test that the frontend configuration script is accessible"""
+    response = client.get('/assets/js/config.js')
+
+    assert response.status_code == 200
+    assert 'BASE_URL' in response.get_data(as_text=True)
+
+
+def test_cors_preflight(client):
+    """Test that the API answers CORS preflight requests from an allowed origin"""
+    origin = 'http://localhost:5000'
+    response = client.options('/api/convert', headers={
+        'Origin': origin,
+        'Access-Control-Request-Method': 'POST',
+        'Access-Control-Request-Headers': 'Content-Type',
+    })
+
+    assert response.status_code == 200
+    assert response.headers['Access-Control-Allow-Origin'] == origin
+
+
+def test_health_endpoint(client):
+    """Test that the health endpoint is accessible from the frontend origin"""
+    response = client.get('/health')
+
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'healthy'
+
+
+def test_conversion_endpoint(post_convert):
+    """Test that the conversion endpoint works"""
+    convert_data = {"amount": 150, "from": "GBP", "to": "JPY"}
+    response = post_convert(convert_data)
+
+    assert response.status_code == 200
+    result = response.get_json()
+    assert result['from_currency'] == 'GBP'
+    assert result['to_currency'] == 'JPY'
+    assert result['converted_amount'] > 0
+
+
+def test_conversion_error_handling(post_convert):
+    """Test that invalid conversions are rejected"""
+    error_data = {"amount": 100, "from": "USD", "to": "INVALID"}
+    response = post_convert(error_data)
+
+    assert response.status_code == 400
+    assert 'error' in response.get_json()
@@ -5,7 +5,6 @@ Unit tests for the /health endpoint
 
 import pytest
 import json
-from datetime import datetime
 
 
 @pytest.mark.unit
@@ -18,67 +17,48 @@ class TestHealthEndpoint:
         response = client.get('/health')
         assert response.status_code == 200
     
-    def test_health_endpoint_returns_json(self, client):
+    def test_health_endpoint_returns_json(self, health_response, health_payload):
         """Test that health endpoint returns valid JSON"""
-        response = client.get('/health')
-        assert response.content_type == 'application/json'
+        assert health_response.content_type == 'application/json'
         
         # Should be able to parse as JSON
-        data = response.get_json()
-        assert data is not None
+        assert health_payload is not None
     
-    def test_health_endpoint_contains_required_fields(self, client, app_config):
+    def test_health_endpoint_contains_required_fields(self, health_payload):
         """Test that health response contains all required fields"""
-        response = client.get('/health')
-        data = response.get_json()
+        data = health_payload
         
         # Check required fields exist
         required_fields = ['status', 'message', 'version', 'timestamp', 'supported_currencies']
         for field in required_fields:
             assert field in data, f"Required field '{field}' missing from health response"
     
-    def test_health_endpoint_status_is_healthy(self, client):
+    def test_health_endpoint_status_is_healthy(self, health_payload):
         """Test that health endpoint reports healthy status"""
-        response = client.get('/health')
-        data = response.get_json()
-        
-        assert data['status'] == 'healthy'
+        assert health_payload['status'] == 'healthy'
     
-    def test_health_endpoint_version_matches_config(self, client, app_config):
+    def test_health_endpoint_version_matches_config(self, health_payload, app_config):
         """Test that health endpoint returns correct API version"""
-        response = client.get('/health')
-        data = response.get_json()
-        
-        assert data['version'] == app_config.API_VERSION
+        assert health_payload['version'] == app_config.API_VERSION
     
-    def test_health_endpoint_supported_currencies(self, client, app_config):
+    def test_health_endpoint_supported_currencies(self, health_payload, supported_currencies):
         """Test that health endpoint returns correct supported currencies"""
-        response = client.get('/health')
-        data = response.get_json()
+        data = health_payload
         
-        assert data['supported_currencies'] == app_config.SUPPORTED_CURRENCIES
+        assert tuple(data['supported_currencies']) == supported_currencies
         assert isinstance(data['supported_currencies'], list)
         assert len(data['supported_currencies']) > 0
     
-    def test_health_endpoint_timestamp_format(self, client):
+    def test_health_endpoint_timestamp_format(self, health_payload, iso_timestamp_re):
         """Test that health endpoint returns valid ISO timestamp"""
-        response = client.get('/health')
-        data = response.get_json()
-        
-        # Should be able to parse the timestamp
-        timestamp_str = data['timestamp']
-        try:
-            parsed_timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-            assert isinstance(parsed_timestamp, datetime)
-        except ValueError:
-            pytest.fail(f"Invalid timestamp format: {timestamp_str}")
+        # Should be an ISO timestamp marked as UTC
+        timestamp_str = health_payload['timestamp']
+        assert iso_timestamp_re.match(timestamp_str), f"Invalid timestamp format: {timestamp_str}"
+        assert timestamp_str.endswith('Z')
     
-    def test_health_endpoint_message_content(self, client):
+    def test_health_endpoint_message_content(self, health_payload):
         """Test that health endpoint returns appropriate message"""
-        response = client.get('/health')
-        data = response.get_json()
-        
-        message = data['message']
+        message = health_payload['message']
         assert isinstance(message, str)
         assert len(message) > 0
         assert 'currency converter' in message.lower() or 'api' in message.lower()
@@ -116,4 +96,12 @@ class TestHealthEndpoint:
         assert response.status_code == 200
         
         data = response.get_json()
-        assert data['status'] == 'healthy'
\ No newline at end of file
+        assert data['status'] == 'healthy'
+        assert response.cache_control.no_store
+    
+    def test_health_endpoint_cache_headers(self, client, app_config):
+        """Test that health responses may be cached briefly by proxies"""
+        response = client.get('/health')
+        
+        assert response.cache_control.public
+        assert response.cache_control.max_age == app_config.HEALTH_CACHE_MAX_AGE
@@ -10,7 +10,105 @@ import time
 import subprocess
 import json
 import os
+import shutil
+import hashlib
+from functools import lru_cache
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from filelock import FileLock
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # Fall back to requests' stdlib-based decoding
+    orjson = None
+
+try:
+    import docker
+except ImportError:  # Fall back to the docker CLI
+    docker = None
+
+
+# Seconds each collection-time daemon probe may take before Docker is skipped
+DOCKER_PROBE_TIMEOUT = 5
+
+# Resolved once so the build-context hash is keyed on one canonical path
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Encoded once for the tests that only need some valid conversion to post
+_CONVERT_PAYLOAD = {"amount": 100, "from": "USD", "to": "EUR"}
+_CONVERT_BODY = (
+    orjson.dumps(_CONVERT_PAYLOAD) if orjson is not None
+    else json.dumps(_CONVERT_PAYLOAD).encode()
+)
+
+# Conversions exercised both one per request and as a single batch
+CONVERSION_CASES = [
+    {"amount": 100, "from": "USD", "to": "EUR"},
+    {"amount": 50, "from": "EUR", "to": "GBP"},
+    {"amount": 1000, "from": "JPY", "to": "USD"},
+    {"amount": 25.5, "from": "GBP", "to": "JPY"}
+]
+
+
+@lru_cache(maxsize=None)
+def _build_context_hash(project_root):
+    """Short hash of the files the Dockerfile copies, or None outside a git checkout"""
+    # git honours .gitignore, so caches and bytecode don't force a rebuild
+    try:
+        result = subprocess.run([
+            "git", "ls-files", "--cached", "--others", "--exclude-standard",
+            "--", "Dockerfile", "README.md", "application"
+        ], cwd=project_root, capture_output=True, text=True)
+    except OSError:  # No git binary
+        return None
+    if result.returncode != 0:
+        return None
+    
+    digest = hashlib.sha256()
+    for name in sorted(result.stdout.splitlines()):
+        path = project_root / name
+        if path.is_file():
+            digest.update(name.encode() + b"\0" + path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+@lru_cache(maxsize=1)
+def _docker_client():
+    """Docker SDK client for the local daemon, or None to drive the docker CLI"""
+    if docker is None:
+        return None
+    # from_env() asks the daemon for its API version, so bound that probe like docker info
+    try:
+        probe = docker.from_env(timeout=DOCKER_PROBE_TIMEOUT)
+    except docker.errors.DockerException:
+        return None
+    api_version = probe.api.api_version
+    probe.close()
+    # Run, stop and logs keep the SDK's default timeout; the known version skips a re-probe
+    return docker.from_env(version=api_version)
+
+
+def _docker_available():
+    """Check once, at collection, that a Docker daemon is reachable"""
+    # build_image always shells out to the docker CLI, even when the SDK runs the container
+    if shutil.which("docker") is None:
+        return False
+    if _docker_client() is not None:
+        return True
+    # Collection is not covered by pytest-timeout, so a wedged daemon must not hang it
+    try:
+        result = subprocess.run(["docker", "info"], timeout=DOCKER_PROBE_TIMEOUT,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except subprocess.TimeoutExpired:
+        return False
+    return result.returncode == 0
+
+
+if not _docker_available():
+    pytest.skip("Docker daemon unavailable", allow_module_level=True)
+
+pytestmark = [pytest.mark.integration, pytest.mark.slow]
 
 
 class ContainerManager:
@@ -18,19 +116,46 @@ class ContainerManager:
     
     def __init__(self, image_name="currency-converter", container_name="currency-converter-test", port=8080):
         self.image_name = image_name
+        context_hash = _build_context_hash(PROJECT_ROOT)
+        self.image_tag = f"{image_name}:{context_hash}" if context_hash else image_name
         self.container_name = container_name
         self.port = port
         self.base_url = f"http://localhost:{port}"
+        self._health_url = f"{self.base_url}/health"
         self.container_id = None
+        self.client = _docker_client()
     
-    def build_image(self):
-        """Build the Docker image"""
-        project_root = Path(__file__).parent.parent.parent
-        print(f"Building Docker image from {project_root}")
-        
-        result = subprocess.run([
-            "docker", "build", "-t", self.image_name, str(project_root)
-        ], capture_output=True, text=True)
+    def image_exists(self):
+        """Check whether the image for the current build context is already built"""
+        if self.client is not None:
+            try:
+                self.client.images.get(self.image_tag)
+                return True
+            except docker.errors.ImageNotFound:
+                return False
+        
+        result = subprocess.run(["docker", "image", "inspect", self.image_tag],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return result.returncode == 0
+    
+    def build_image(self, timeout=600):
+        """Build the Docker image unless this build context was already built"""
+        if self.image_tag != self.image_name and self.image_exists():
+            print(f"Docker image {self.image_tag} is up to date")
+            return True
+        
+        print(f"Building Docker image from {PROJECT_ROOT}")
+        
+        # BuildKit reuses cached layers between runs; --quiet leaves only errors on stderr
+        try:
+            result = subprocess.run([
+                "docker", "build", "--quiet", "-t", self.image_tag, str(PROJECT_ROOT)
+            ], env={**os.environ, "DOCKER_BUILDKIT": "1"},
+               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+               timeout=timeout)
+        except subprocess.TimeoutExpired:
+            print(f"Docker build timed out after {timeout}s")
+            return False
         
         if result.returncode != 0:
             print(f"Docker build failed: {result.stderr}")
@@ -44,79 +169,155 @@ class ContainerManager:
         # Stop and remove existing container if it exists
         self.stop_container()
         
-        result = subprocess.run([
-            "docker", "run", "-d", 
-            "-p", f"{self.port}:8080",
-            "--name", self.container_name,
-            self.image_name
-        ], capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            print(f"Failed to start container: {result.stderr}")
-            return False
+        if self.client is not None:
+            try:
+                container = self.client.containers.run(
+                    self.image_tag, detach=True,
+                    ports={"8080/tcp": self.port},
+                    name=self.container_name
+                )
+            except docker.errors.APIError as e:
+                print(f"Failed to start container: {e}")
+                return False
+            self.container_id = container.id
+        else:
+            result = subprocess.run([
+                "docker", "run", "-d", 
+                "-p", f"{self.port}:8080",
+                "--name", self.container_name,
+                self.image_tag
+            ], capture_output=True, text=True)
+            
+            if result.returncode != 0:
+                print(f"Failed to start container: {result.stderr}")
+                return False
+            self.container_id = result.stdout.strip()
         
-        self.container_id = result.stdout.strip()
         print(f"Container started with ID: {self.container_id}")
         
         # Wait for container to be ready
         return self.wait_for_health()
     
-    def wait_for_health(self, timeout=30, interval=2):
-        """Wait for the container to be healthy"""
+    def is_running(self):
+        """Check whether the container is still running"""
+        if self.client is not None:
+            try:
+                return self.client.containers.get(self.container_name).status == "running"
+            except docker.errors.NotFound:
+                return False
+        
+        result = subprocess.run([
+            "docker", "inspect", "-f", "{{.State.Running}}", self.container_name
+        ], capture_output=True, text=True)
+        return result.stdout.strip() == "true"
+    
+    def wait_for_health(self, timeout=30, initial_delay=0.05, max_delay=1.0):
+        """Wait for the container to be healthy, backing off between attempts"""
         print("Waiting for container to be ready...")
         
-        for attempt in range(timeout // interval):
-            try:
-                response = requests.get(f"{self.base_url}/health", timeout=5)
-                if response.status_code == 200:
-                    print("Container is ready!")
-                    return True
-            except requests.exceptions.RequestException:
-                pass
-            
-            time.sleep(interval)
-            print(f"Attempt {attempt + 1}/{timeout // interval}: Container not ready yet...")
+        deadline = time.monotonic() + timeout
+        delay = initial_delay
+        with requests.Session() as session:
+            while time.monotonic() < deadline:
+                try:
+                    response = session.get(self._health_url, timeout=1)
+                    if response.status_code == 200:
+                        print("Container is ready!")
+                        return True
+                except requests.exceptions.RequestException:
+                    pass
+                
+                # A crashed container will never become healthy, so stop waiting
+                if not self.is_running():
+                    print(f"Container exited before becoming ready:\n{self.get_logs()}")
+                    return False
+                
+                time.sleep(min(delay, max(deadline - time.monotonic(), 0)))
+                delay = min(delay * 1.7, max_delay)
         
         print("Container failed to become ready within timeout")
         return False
     
     def stop_container(self):
         """Stop and remove the Docker container"""
-        # Stop container
-        subprocess.run(["docker", "stop", self.container_name], 
-                      capture_output=True, text=True)
-        
-        # Remove container
-        subprocess.run(["docker", "rm", self.container_name], 
-                      capture_output=True, text=True)
+        if self.client is not None:
+            try:
+                container = self.client.containers.get(self.container_name)
+                container.stop()
+                container.remove()
+            except docker.errors.NotFound:
+                pass
+        else:
+            # Stop container
+            subprocess.run(["docker", "stop", self.container_name], 
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            
+            # Remove container
+            subprocess.run(["docker", "rm", self.container_name], 
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         
         self.container_id = None
     
     def get_logs(self):
         """Get container logs"""
-        if self.container_id:
-            result = subprocess.run(["docker", "logs", self.container_name], 
-                                  capture_output=True, text=True)
-            return result.stdout
-        return ""
+        if not self.container_id:
+            return ""
+        
+        if self.client is not None:
+            # The SDK returns stdout and stderr together by default
+            return self.client.containers.get(self.container_name).logs().decode()
+        
+        result = subprocess.run(["docker", "logs", self.container_name], 
+                              capture_output=True, text=True)
+        # The app logs to stderr, which docker logs replays on our stderr
+        return result.stdout + result.stderr
 
 
 @pytest.fixture(scope="session")
-def container_manager():
-    """Session-scoped fixture to manage the test container"""
+def container_manager(tmp_path_factory):
+    """Session-scoped fixture to manage the test container, shared by xdist workers
+
+    The first worker to take the lock builds and starts the container, the others
+    reuse it, and the last one to finish stops it.
+    """
     manager = ContainerManager()
     
-    # Build and start container
-    if not manager.build_image():
-        pytest.skip("Failed to build Docker image")
+    # xdist workers each get their own basetemp under a directory shared by the run
+    shared_dir = tmp_path_factory.getbasetemp()
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        shared_dir = shared_dir.parent
+    state_file = shared_dir / "container.json"
+    lock = FileLock(str(shared_dir / "container.lock"))
     
-    if not manager.start_container():
-        pytest.skip("Failed to start Docker container")
+    with lock:
+        if state_file.exists():
+            state = json.loads(state_file.read_text())
+        elif not manager.build_image():
+            state = {"error": "Failed to build Docker image"}
+        elif not manager.start_container():
+            state = {"error": "Failed to start Docker container"}
+        else:
+            state = {"container_id": manager.container_id, "users": 0}
+        
+        if "error" not in state:
+            state["users"] += 1
+        state_file.write_text(json.dumps(state))
     
+    if "error" in state:
+        pytest.skip(state["error"])
+    
+    manager.container_id = state["container_id"]
     yield manager
     
-    # Cleanup
-    manager.stop_container()
+    # Cleanup once no worker is using the container any more
+    with lock:
+        state = json.loads(state_file.read_text())
+        state["users"] -= 1
+        if state["users"] > 0:
+            state_file.write_text(json.dumps(state))
+        else:
+            manager.stop_container()
+            state_file.unlink()
 
 
 @pytest.fixture
@@ -132,6 +333,10 @@ class APIClient:
         self.base_url = base_url
         self.session = requests.Session()
         self.session.headers.update({'Content-Type': 'application/json'})
+        
+        # Keep enough pooled connections for concurrent tests sharing this session
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=16)
+        self.session.mount("http://", adapter)
     
     def get(self, path):
         """Make GET request"""
@@ -140,10 +345,18 @@ class APIClient:
     def post(self, path, data=None):
         """Make POST request"""
         return self.session.post(f"{self.base_url}{path}", json=data)
+    
+    def post_raw(self, path, body):
+        """Make POST request with an already-encoded JSON body"""
+        return self.session.post(f"{self.base_url}{path}", data=body)
+    
+    def json(self, response):
+        """Decode a JSON response body, with orjson when it is installed"""
+        if orjson is None:
+            return response.json()
+        return orjson.loads(response.content)
 
 
-@pytest.mark.integration
-@pytest.mark.slow
 class TestContainerizedApp:
     """Integration tests for the containerized application"""
     
@@ -152,7 +365,7 @@ class TestContainerizedApp:
         response = api_client.get("/health")
         
         assert response.status_code == 200
-        data = response.json()
+        data = api_client.json(response)
         
         assert data["status"] == "healthy"
         assert "version" in data
@@ -178,7 +391,7 @@ class TestContainerizedApp:
         response = api_client.get("/api/info")
         
         assert response.status_code == 200
-        data = response.json()
+        data = api_client.json(response)
         
         required_fields = ["name", "version", "endpoints", "supported_currencies"]
         for field in required_fields:
@@ -187,23 +400,19 @@ class TestContainerizedApp:
         assert "Currency Converter" in data["name"]
         assert isinstance(data["endpoints"], dict)
     
-    def test_container_currency_conversion(self, api_client):
+    @pytest.mark.parametrize("conversion_data", CONVERSION_CASES,
+                             ids=lambda case: f"{case['from']}->{case['to']}")
+    def test_container_currency_conversion(self, api_client, conversion_data):
         """Test currency conversion functionality in the container"""
-        conversion_data = {
-            "amount": 100,
-            "from": "USD",
-            "to": "EUR"
-        }
-        
         response = api_client.post("/api/convert", conversion_data)
         
         assert response.status_code == 200
-        data = response.json()
+        data = api_client.json(response)
         
         assert data["success"] is True
-        assert data["original_amount"] == 100
-        assert data["from_currency"] == "USD"
-        assert data["to_currency"] == "EUR"
+        assert data["original_amount"] == conversion_data["amount"]
+        assert data["from_currency"] == conversion_data["from"]
+        assert data["to_currency"] == conversion_data["to"]
         assert "converted_amount" in data
         assert "exchange_rate" in data
         assert data["converted_amount"] > 0
@@ -214,7 +423,7 @@ class TestContainerizedApp:
         response = api_client.get("/api/rates")
         
         assert response.status_code == 200
-        data = response.json()
+        data = api_client.json(response)
         
         assert "base_currency" in data
         assert "rates" in data
@@ -242,7 +451,7 @@ class TestContainerizedApp:
         response = api_client.post("/api/convert", invalid_data)
         assert response.status_code == 400
         
-        data = response.json()
+        data = api_client.json(response)
         assert "error" in data
     
     def test_container_unsupported_currency(self, api_client):
@@ -256,7 +465,7 @@ class TestContainerizedApp:
         response = api_client.post("/api/convert", invalid_data)
         assert response.status_code == 400
         
-        data = response.json()
+        data = api_client.json(response)
         assert "error" in data
         assert "supported_currencies" in data
     
@@ -270,20 +479,16 @@ class TestContainerizedApp:
     
     def test_container_multiple_conversions(self, api_client):
         """Test multiple currency conversions to ensure consistency"""
-        test_cases = [
-            {"amount": 100, "from": "USD", "to": "EUR"},
-            {"amount": 50, "from": "EUR", "to": "GBP"},
-            {"amount": 1000, "from": "JPY", "to": "USD"},
-            {"amount": 25.5, "from": "GBP", "to": "JPY"}
-        ]
-        
-        for test_case in test_cases:
-            response = api_client.post("/api/convert", test_case)
-            
-            assert response.status_code == 200, f"Failed for conversion: {test_case}"
-            data = response.json()
-            
-            assert data["success"] is True
+        # One round trip through the batch endpoint; test_container_currency_conversion
+        # covers the same cases one request at a time
+        response = api_client.post("/api/convert/batch", {"conversions": CONVERSION_CASES})
+        
+        assert response.status_code == 200
+        results = api_client.json(response)["results"]
+        assert len(results) == len(CONVERSION_CASES)
+        
+        for test_case, data in zip(CONVERSION_CASES, results):
+            assert data.get("success") is True, f"Failed for conversion: {test_case}"
             assert data["original_amount"] == test_case["amount"]
             assert data["from_currency"] == test_case["from"]
             assert data["to_currency"] == test_case["to"]
@@ -317,10 +522,8 @@ class TestContainerizedApp:
         assert response_time < 1.0, f"Health check took too long: {response_time:.2f}s"
         
         # Test conversion performance
-        conversion_data = {"amount": 100, "from": "USD", "to": "EUR"}
-        
         start_time = time.time()
-        response = api_client.post("/api/convert", conversion_data)
+        response = api_client.post_raw("/api/convert", _CONVERT_BODY)
         end_time = time.time()
         
         assert response.status_code == 200
@@ -330,40 +533,19 @@ class TestContainerizedApp:
         assert conversion_time < 1.0, f"Conversion took too long: {conversion_time:.2f}s"
 
 
-@pytest.mark.integration
-@pytest.mark.slow
 class TestContainerizedAppEdgeCases:
     """Edge case tests for the containerized application"""
     
     def test_container_concurrent_requests(self, api_client):
         """Test handling of concurrent requests to the containerized app"""
-        import threading
-        import queue
+        # Open a pooled connection first so the burst reuses keep-alive sockets
+        api_client.get("/health")
         
-        results = queue.Queue()
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            futures = [executor.submit(api_client.get, "/health") for _ in range(10)]
+            status_codes = [future.result().status_code for future in futures]
         
-        def make_request():
-            try:
-                response = api_client.get("/health")
-                results.put(response.status_code)
-            except Exception as e:
-                results.put(str(e))
-        
-        # Create and start multiple threads
-        threads = []
-        for i in range(10):
-            thread = threading.Thread(target=make_request)
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-        
-        # Check results
-        while not results.empty():
-            result = results.get()
-            assert result == 200, f"Concurrent request failed: {result}"
+        assert status_codes == [200] * 10, f"Concurrent requests failed: {status_codes}"
     
     def test_container_large_conversion_amount(self, api_client):
         """Test conversion with very large amounts"""
@@ -376,7 +558,7 @@ class TestContainerizedAppEdgeCases:
         response = api_client.post("/api/convert", large_amount_data)
         
         assert response.status_code == 200
-        data = response.json()
+        data = api_client.json(response)
         assert data["success"] is True
         assert data["converted_amount"] > 0
     
@@ -391,7 +573,7 @@ class TestContainerizedAppEdgeCases:
         response = api_client.post("/api/convert", zero_amount_data)
         
         assert response.status_code == 200
-        data = response.json()
+        data = api_client.json(response)
         assert data["success"] is True
         assert data["converted_amount"] == 0
         assert data["original_amount"] == 0
@@ -401,7 +583,7 @@ class TestContainerizedAppEdgeCases:
         # Make a few requests to generate logs
         api_client = APIClient(container_manager.base_url)
         api_client.get("/health")
-        api_client.post("/api/convert", {"amount": 100, "from": "USD", "to": "EUR"})
+        api_client.post_raw("/api/convert", _CONVERT_BODY)
         
         # Get logs
         logs = container_manager.get_logs()